@@ -1,10 +1,12 @@
 from cx_Freeze import setup, Executable
 
+from ged2doc import __version__
+
 # Dependencies are automatically detected, but it might need fine tuning.
 build_exe_options = {"excludes": ["tkinter"]}
 
 setup(name="ged2doc",
-      version="0.5.1",
+      version=__version__,
       description="ged2doc command line tool",
       options={"build_exe": build_exe_options},
       executables=[Executable("freeze\\freeze_main.py",
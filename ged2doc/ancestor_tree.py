@@ -12,6 +12,16 @@ from .textbox import TextBox
 
 _log = logging.getLogger(__name__)
 
+# frequently used constant sizes, Size instances are never modified in place
+_ZERO = Size()
+_PAD2 = Size('2pt')
+_PAD4 = Size('4pt')
+
+# kinds of visitor calls
+_VISIT_NODE = 0
+_VISIT_MOTHER_EDGE = 1
+_VISIT_FATHER_EDGE = 2
+
 
 class TreeNode:
     """Class representing node in a tree, which is a box with a person name.
@@ -34,34 +44,44 @@ class TreeNode:
         Size of the font for the text.
     gen_dist : `ged2doc.size.Size`
         Horiz. distance between generations.
+    layout : `bool`, optional
+        If ``True`` (default) then calculate Y positions of all boxes in the
+        sub-tree, otherwise `setY0` has to be called to do that.
     """
 
-    _vpadding = Size('2pt')  # vertical padding around each sub-tree or node
+    __slots__ = ('mother', 'father', 'generation', '_person', 'name', '_box',
+                 '_subtree_height')
+
+    _vpadding = _PAD2  # vertical padding around each sub-tree or node
 
     def __init__(self, person, gen, motherNode, fatherNode, box_width,
-                 max_box_width, font_size, gen_dist):
+                 max_box_width, font_size, gen_dist, layout=True):
         self.mother = motherNode
         self.father = fatherNode
         self.generation = gen
         self._person = person
 
         # displayed persons name
+        href = None
         if person is None:
             self.name = '?'
-        elif gen == 0:
-            self.name = (person.name.first or '') + ' ' + \
-                (person.name.maiden or person.name.surname or '')
-            if not self.name.strip():
-                self.name = '...'
         else:
-            self.name = (person.name.first or '') + ' ' + \
-                (person.name.surname or '')
-        href = None if person is None else ('#person.' + person.xref_id)
+            name = person.name
+            if gen == 0:
+                self.name = (name.first or '') + ' ' + \
+                    (name.maiden or name.surname or '')
+                if not self.name.strip():
+                    self.name = '...'
+            else:
+                self.name = (name.first or '') + ' ' + (name.surname or '')
+            href = '#person.' + person.xref_id
         x0 = gen * (gen_dist + box_width)
         self._box = TextBox(text=self.name, x0=x0, width=box_width,
                             maxwidth=max_box_width, font_size=font_size,
                             href=href)
-        self.setY0(Size())
+        self._subtree_height = None
+        if layout:
+            self._layout(0.)
 
     @property
     def person(self):
@@ -79,12 +99,17 @@ class TreeNode:
     def subTreeHeight(self):
         """The height of the whole tree including parent boxes (`Size`).
         """
-        h = Size()
-        if self.mother:
-            h = self.mother.subTreeHeight + self.father.subTreeHeight + self._vpadding
-        h = max(h, self._box.height)
-        _log.debug('TreeNode.name = %s; height = %s', self.name, h)
-        return h
+        return Size(self._treeHeight())
+
+    def _treeHeight(self):
+        """Return the height of the whole tree in inches (`float`).
+
+        Value is computed on first access and cached, tree structure does not
+        change after construction.
+        """
+        if self._subtree_height is None:
+            self._subTreeHeights(*self._flatten())
+        return self._subtree_height
 
     def setY0(self, y0):
         """Recalculate Y position of box tree so that topmost box is at `y0`.
@@ -95,17 +120,97 @@ class TreeNode:
             New topmost box position, accepts anything convertible to
             `ged2doc.size.Size`.
         """
-        y0 = Size(y0)
-        _log.debug('TreeNode.name = %s; setY0 = %s', self.name, y0)
-        if self.mother:
-            self.mother.setY0(y0)
-            self.father.setY0(y0 + self._vpadding + self.mother.subTreeHeight)
-            # sodd formula need for better precision
-            self._box.y0 = (2 * self.mother.textbox.y0 + self.mother.textbox.height +
-                            2 * self.father.textbox.y0 + self.father.textbox.height -
-                            2 * self.textbox.height) / 4
-        else:
-            self._box.y0 = y0
+        if not isinstance(y0, Size):
+            y0 = Size(y0)
+        self._layout(y0.value)
+
+    def _flatten(self):
+        """Flatten the sub-tree into parallel lists in pre-order.
+
+        Returns
+        -------
+        nodes : `list` [ `TreeNode` ]
+            Nodes of the sub-tree, this node is the first one.
+        mothers, fathers : `list` [ `int` ]
+            Indices of mother and father nodes, -1 if there are no parents.
+        """
+        nodes, mothers, fathers = [], [], []
+        stack = [(self, -1, None)]
+        while stack:
+            node, child, links = stack.pop()
+            idx = len(nodes)
+            if links is not None:
+                links[child] = idx
+            nodes.append(node)
+            mothers.append(-1)
+            fathers.append(-1)
+            if node.mother:
+                stack += [(node.father, idx, fathers), (node.mother, idx, mothers)]
+        return nodes, mothers, fathers
+
+    def _subTreeHeights(self, nodes, mothers, fathers):
+        """Calculate sub-tree heights for flattened nodes and cache them.
+
+        Returns list of heights in inches.
+        """
+        debug = _log.isEnabledFor(logging.DEBUG)
+        vpadding = self._vpadding.value
+        heights = [0.] * len(nodes)
+        # In reverse order parent nodes are before their child.
+        for idx in range(len(nodes) - 1, -1, -1):
+            node = nodes[idx]
+            h = node._subtree_height
+            if h is None:
+                h = 0.
+                m = mothers[idx]
+                if m >= 0:
+                    h = heights[m] + heights[fathers[idx]] + vpadding
+                h = max(h, node._box.height.value)
+                if debug:
+                    _log.debug('TreeNode.name = %s; height = %s', node.name, Size(h))
+                node._subtree_height = h
+            heights[idx] = h
+        return heights
+
+    def _layout(self, y0, flat=None):
+        """Position all boxes in the sub-tree so that topmost box is at
+        ``y0``, which is in inches (`float`).
+
+        ``flat`` is the result of `_flatten` call if it is already known.
+        Returns height of the sub-tree in inches.
+        """
+        debug = _log.isEnabledFor(logging.DEBUG)
+        vpadding = self._vpadding.value
+        nodes, mothers, fathers = flat or self._flatten()
+        heights = self._subTreeHeights(nodes, mothers, fathers)
+
+        # Top of each sub-tree, in pre-order parent nodes follow their child.
+        tops = [y0] * len(nodes)
+        for idx, top in enumerate(tops):
+            if debug:
+                _log.debug('TreeNode.name = %s; setY0 = %s', nodes[idx].name, Size(top))
+            m = mothers[idx]
+            if m >= 0:
+                tops[m] = top
+                tops[fathers[idx]] = top + vpadding + heights[m]
+
+        # In reverse order parent nodes are positioned before their child.
+        y0s = [0.] * len(nodes)
+        for idx in range(len(nodes) - 1, -1, -1):
+            box = nodes[idx]._box
+            m = mothers[idx]
+            if m < 0:
+                y = tops[idx]
+            else:
+                f = fathers[idx]
+                # sodd formula need for better precision
+                y = (2 * y0s[m] + nodes[m]._box.height.value +
+                     2 * y0s[f] + nodes[f]._box.height.value -
+                     2 * box.height.value) / 4
+            y0s[idx] = y
+            box.y0 = Size(y)
+
+        return heights[0]
 
 
 class AncestorTree:
@@ -129,32 +234,47 @@ class AncestorTree:
     def __init__(self, person, max_gen=4, width="5in", gen_dist="12pt", font_size="10pt"):
         self.max_gen = max_gen
         self._width = Size(width)
-        self._height = Size()
+        self._height = _ZERO
         self.gen_dist = Size(gen_dist)
         self.font_size = Size(font_size)
         self.root = None
-
-        def _genDepth(person, max_gen):
-            """Return number known generations for a person"""
-            if not person:
-                return 0
-            if max_gen == 0:
-                return 0
-            return max(_genDepth(person.father, max_gen - 1), _genDepth(person.mother, max_gen - 1)) + 1
-
-        def _boxes(box):
-            """Generator for person parents, returns None for unknown parent"""
-            yield box
-            if box.mother:
-                for p in _boxes(box.mother):
-                    yield p
-                for p in _boxes(box.father):
-                    yield p
+        self._nodes = []  # all tree nodes in depth-first order
+        self._events = []  # sequence of visitor calls
+
+        def _pedigree(person, max_gen):
+            """Walk person ancestors once, return number of known generations
+            and the shape of the tree.
+
+            Tree shape is a list of ``(person, gen, expanded)`` tuples in the
+            post-order (parents before children), ``expanded`` is True if the
+            node has parent nodes. Items beyond ``max_gen`` are ``None``.
+            """
+            depth = 0
+            pedigree = []
+            stack = [(person, 0, False)]
+            while stack:
+                person, gen, expanded = stack.pop()
+                if gen >= max_gen:
+                    pedigree.append(None)
+                    continue
+                if person is not None:
+                    depth = max(depth, gen + 1)
+                if not expanded and person is not None:
+                    mother, father = person.mother, person.father
+                    if mother is not None or father is not None:
+                        stack += [(person, gen, True),
+                                  (father, gen + 1, False),
+                                  (mother, gen + 1, False)]
+                        continue
+                pedigree.append((person, gen, expanded))
+            return depth, pedigree
 
         # get the number of generations, limit to max_gen
-        ngen = _genDepth(person, self.max_gen)
-        _log.debug('parent_tree: person = %s', person.name)
-        _log.debug('parent_tree: ngen = %d', ngen)
+        ngen, pedigree = _pedigree(person, self.max_gen)
+        debug = _log.isEnabledFor(logging.DEBUG)
+        if debug:
+            _log.debug('parent_tree: person = %s', person.name)
+            _log.debug('parent_tree: ngen = %d', ngen)
 
         # if no parents then tree is empty
         if ngen < 2:
@@ -162,31 +282,38 @@ class AncestorTree:
 
         # calculate horizontal size of each box
         box_width = (self._width - (self.max_gen - 1) * self.gen_dist -
-                     Size('4pt')) / self.max_gen
+                     _PAD4) / self.max_gen
         max_box_width = (self._width - (ngen - 1) * self.gen_dist -
-                         Size('4pt')) / ngen
+                         _PAD4) / ngen
 
         # build tree
-        self.root = self._makeTree(person, 0, ngen, box_width, max_box_width)
+        self.root, gen_widths = self._makeTree(pedigree, box_width, max_box_width)
+        flat = self.root._flatten()
+        self._nodes = flat[0]
+        self._events = self._makeEvents(self.root)
 
-        # add small padding, get full height
-        self._height = self.root.subTreeHeight + Size("4pt")
-        self.root.setY0("2pt")
+        # position all boxes, add small padding to get full height
+        self._height = Size(self.root._layout(_PAD2.value, flat)) + _PAD4
 
         # update box width for every generation and calculate total width
-        width = Size('2pt')  # extra 1pt to avoid cropping
-        for gen in range(ngen):
-            gen_width = max(pbox.textbox.width for pbox in _boxes(self.root)
-                            if pbox.generation == gen)
-            for pbox in _boxes(self.root):
-                if pbox.generation == gen:
-                    pbox.textbox.width = gen_width
-                    pbox.textbox.x0 = width
+        # (arithmetic is done on floats in inches)
+        gen_dist = self.gen_dist.value
+        width = _PAD2.value  # extra 1pt to avoid cropping
+        generations = [[] for gen in range(ngen)]
+        for pbox in self._nodes:
+            generations[pbox.generation].append(pbox)
+        for gen_width, gen_boxes in zip(gen_widths, generations):
+            gen_width_size = Size(gen_width)
+            x0 = Size(width)
+            for pbox in gen_boxes:
+                pbox.textbox.width = gen_width_size
+                pbox.textbox.x0 = x0
+                if debug:
                     _log.debug('parent_tree: %s', pbox.textbox)
-            width += gen_width + self.gen_dist
-        width -= self.gen_dist
-        width += Size('2pt')  # extra 1pt to avoid cropping
-        self._width = width
+            width += gen_width + gen_dist
+        width -= gen_dist
+        width += _PAD2.value  # extra 1pt to avoid cropping
+        self._width = Size(width)
         _log.debug('parent_tree: size = %s x %s', self._width, self._height)
 
     @property
@@ -209,37 +336,63 @@ class AncestorTree:
         visitor : `AncestorTreeVisitor`
             Tree visitor.
         """
-        if self.root:
-            self._visit(visitor, self.root)
+        methods = (visitor.visitNode, visitor.visitMotherEdge, visitor.visitFatherEdge)
+        for kind, args in self._events:
+            methods[kind](*args)
+
+    def _makeEvents(self, root):
+        """Make the sequence of visitor calls for a tree.
 
-    def _visit(self, visitor, node):
-        """Helper method for recursive visiting of the nodes.
+        Nodes are visited in depth-first order, edge is visited after the
+        whole sub-tree of the parent node. Returns list of tuples ``(kind,
+        args)``, kind is one of ``_VISIT_*`` constants.
         """
-        visitor.visitNode(node)
-        if node.mother:
-            self._visit(visitor, node.mother)
-            visitor.visitMotherEdge(node, node.mother)
-        if node.father:
-            self._visit(visitor, node.father)
-            visitor.visitFatherEdge(node, node.father)
-
-    def _makeTree(self, person, gen, max_gen, box_width, max_box_width):
-        """Recursively generate tree of TreeNode instances.
-
-        Fro internal use only.
+        events = []
+        # stack items are (kind, args)
+        stack = [(_VISIT_NODE, (root,))]
+        while stack:
+            kind, args = stack.pop()
+            events.append((kind, args))
+            if kind == _VISIT_NODE:
+                node, = args
+                if node.father:
+                    stack += [(_VISIT_FATHER_EDGE, (node, node.father)), (_VISIT_NODE, (node.father,))]
+                if node.mother:
+                    stack += [(_VISIT_MOTHER_EDGE, (node, node.mother)), (_VISIT_NODE, (node.mother,))]
+        return events
+
+    def _makeTree(self, pedigree, box_width, max_box_width):
+        """Generate tree of TreeNode instances from a tree shape.
+
+        Returns root node and the list of maximum box widths (in inches) for
+        each generation. Fro internal use only.
         """
-        if gen < max_gen:
-
+        # All boxes start with the same width and can only grow when text
+        # does not fit, so only grown boxes need to update maximum width.
+        gen_widths = [box_width.value] * self.max_gen
+
+        # Pedigree is in post-order, parent nodes are made before TreeNode
+        # for a person.
+        nodes = []
+        for item in pedigree:
+            if item is None:
+                nodes.append(None)
+                continue
+            person, gen, expanded = item
             motherTree = None
             fatherTree = None
-            if person and (person.mother or person.father):
-                motherTree = self._makeTree(person.mother, gen + 1, max_gen,
-                                            box_width, max_box_width)
-                fatherTree = self._makeTree(person.father, gen + 1, max_gen,
-                                            box_width, max_box_width)
+            if expanded:
+                fatherTree = nodes.pop()
+                motherTree = nodes.pop()
+            # whole tree is positioned once after it is built
             box = TreeNode(person, gen, motherTree, fatherTree, box_width,
-                           max_box_width, self.font_size, self.gen_dist)
-            return box
+                           max_box_width, self.font_size, self.gen_dist,
+                           layout=False)
+            nodes.append(box)
+            width = box.textbox.width.value
+            if width > gen_widths[gen]:
+                gen_widths[gen] = width
+        return nodes.pop(), gen_widths
 
 
 class AncestorTreeVisitor(metaclass=abc.ABCMeta):
@@ -39,7 +39,9 @@ class EMFTreeVisitor(AncestorTreeVisitor):
         self._gray_pen = ("solid", Size("1pt", self._dpi), _GRAY)
         self._emf.set_bkmode(dumbemf.BackgroundMode.TRANSPARENT)
 
-        self._fonts = {}
+        self._fonts = {}  # font sizes converted to image DPI
+        # (left, right, midy) of every visited node converted to image DPI
+        self._coords = {}
 
     def visitNode(self, node):
         # docstring inherited from base class
@@ -56,20 +58,25 @@ class EMFTreeVisitor(AncestorTreeVisitor):
             bottom = textbox.y1.to_dpi(self._dpi)
             self._emf.rectangle(left, top, right, bottom)
 
+        # edges are visited after their nodes, keep coordinates for them
+        self._coords[node] = (left, right, textbox.midy.to_dpi(self._dpi))
+
         self._emf.text_align("c")
         self._emf.text_color(_GRAY if node.person is None else _BLACK)
 
-        fontsize = textbox.font_size.to_dpi(self._dpi)
+        # all nodes usually share the same font size
+        fontsize = self._fonts.get(textbox.font_size.value)
+        if fontsize is None:
+            fontsize = textbox.font_size.to_dpi(self._dpi)
+            self._fonts[textbox.font_size.value] = fontsize
         with self._emf.use_font(fontsize):
             for line, (x, y) in textbox.lines_pos():
                 self._emf.text(x.to_dpi(self._dpi), y.to_dpi(self._dpi), line)
 
     def visitMotherEdge(self, node, parentNode):
         # docstring inherited from base class
-        x0 = node.textbox.x1.to_dpi(self._dpi)
-        y0 = node.textbox.midy.to_dpi(self._dpi)
-        x1 = parentNode.textbox.x0.to_dpi(self._dpi)
-        y1 = parentNode.textbox.midy.to_dpi(self._dpi)
+        _, x0, y0 = self._coords[node]
+        x1, _, y1 = self._coords[parentNode]
         midx = (x0 + x1) / 2
 
         # draw connections
@@ -84,10 +91,8 @@ class EMFTreeVisitor(AncestorTreeVisitor):
 
     def visitFatherEdge(self, node, parentNode):
         # docstring inherited from base class
-        x0 = node.textbox.x1.to_dpi(self._dpi)
-        y0 = node.textbox.midy.to_dpi(self._dpi)
-        x1 = parentNode.textbox.x0.to_dpi(self._dpi)
-        y1 = parentNode.textbox.midy.to_dpi(self._dpi)
+        _, x0, y0 = self._coords[node]
+        x1, _, y1 = self._coords[parentNode]
         midx = (x0 + x1) / 2
 
         # draw connections
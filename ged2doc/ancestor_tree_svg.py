@@ -16,6 +16,10 @@ _rect_unknown_style = "fill:none;stroke-width:1pt;stroke:grey"
 _pline_style = "fill:none;stroke-width:0.5pt;stroke:black"
 _pline_unknown_style = "fill:none;stroke-width:0.5pt;stroke:grey"
 
+# (text class, rectangle style) for known and unknown persons, indexed by
+# ``node.person is None``
+_node_styles = (('svglink', _rect_style), (None, _rect_unknown_style))
+
 
 class SVGTreeVisitor(AncestorTreeVisitor):
     """`~ged2doc.ancestor_tree.AncestorTreeVisitor` implementation which makes
@@ -32,46 +36,51 @@ class SVGTreeVisitor(AncestorTreeVisitor):
         self._units = units
         self._fullxml = fullxml
         self._elements = []
+        # (x0, x1, midy) of every visited node
+        self._coords = {}
 
     def visitNode(self, node):
         # docstring inherited from base class
         units = self._units
 
-        textclass = None if node.person is None else 'svglink'
-        style = _rect_unknown_style if node.person is None else _rect_style
-        self._elements += self._textbox_svg(node.textbox, textclass=textclass,
-                                            units=units, rect_style=style)
+        textbox = node.textbox
+        textclass, style = _node_styles[node.person is None]
+        self._elements.extend(self._textbox_svg(textbox, textclass=textclass,
+                                                units=units, rect_style=style))
+
+        # edges are visited after their nodes, keep coordinates for them
+        self._coords[node] = (textbox.x0, textbox.x1, textbox.midy)
 
     def visitMotherEdge(self, node, parentNode):
         # docstring inherited from base class
         units = self._units
 
-        x0 = node.textbox.x1
-        y0 = node.textbox.midy
-        x1 = parentNode.textbox.x0
-        y1 = parentNode.textbox.midy
+        _, x0, y0 = self._coords[node]
+        x1, _, y1 = self._coords[parentNode]
         midx = (x0 + x1) / 2
         style = _pline_unknown_style if parentNode.person is None else _pline_style
-        self._elements += [
-            Line(x1=x0 ^ units, y1=y0 ^ units, x2=midx ^ units, y2=y0 ^ units, style=_pline_style),
-            Line(x1=midx ^ units, y1=y0 ^ units, x2=midx ^ units, y2=y1 ^ units, style=style),
-            Line(x1=midx ^ units, y1=y1 ^ units, x2=x1 ^ units, y2=y1 ^ units, style=style),
-        ]
+
+        # format each coordinate only once
+        x0, y0, x1, y1, midx = x0 ^ units, y0 ^ units, x1 ^ units, y1 ^ units, midx ^ units
+        append = self._elements.append
+        append(Line(x1=x0, y1=y0, x2=midx, y2=y0, style=_pline_style))
+        append(Line(x1=midx, y1=y0, x2=midx, y2=y1, style=style))
+        append(Line(x1=midx, y1=y1, x2=x1, y2=y1, style=style))
 
     def visitFatherEdge(self, node, parentNode):
         # docstring inherited from base class
         units = self._units
 
-        x0 = node.textbox.x1
-        y0 = node.textbox.midy
-        x1 = parentNode.textbox.x0
-        y1 = parentNode.textbox.midy
+        _, x0, y0 = self._coords[node]
+        x1, _, y1 = self._coords[parentNode]
         midx = (x0 + x1) / 2
         style = _pline_unknown_style if parentNode.person is None else _pline_style
-        self._elements += [
-            Line(x1=midx ^ units, y1=y0 ^ units, x2=midx ^ units, y2=y1 ^ units, style=style),
-            Line(x1=midx ^ units, y1=y1 ^ units, x2=x1 ^ units, y2=y1 ^ units, style=style),
-        ]
+
+        # format each coordinate only once
+        y0, x1, y1, midx = y0 ^ units, x1 ^ units, y1 ^ units, midx ^ units
+        append = self._elements.append
+        append(Line(x1=midx, y1=y0, x2=midx, y2=y1, style=style))
+        append(Line(x1=midx, y1=y1, x2=x1, y2=y1, style=style))
 
     def makeSVG(self, width, height):
         """Produce SVG document from a visited tree.
@@ -102,8 +111,7 @@ class SVGTreeVisitor(AncestorTreeVisitor):
 
         # produce complete XML
         svg = Doc(width=width ^ units, height=height ^ units)
-        for element in self._elements:
-            svg.add(element)
+        svg.extend(self._elements)
 
         # generate full XML
         xml = svg.xml(self._fullxml)
@@ -116,18 +124,14 @@ class SVGTreeVisitor(AncestorTreeVisitor):
         shapes = []
 
         # render box
-        kw = dict(x=textbox.x0 ^ units, y=textbox.y0 ^ units,
-                  width=textbox.width ^ units, height=textbox.height ^ units)
-        if rect_style:
-            kw['style'] = rect_style
-        rect = Rect(**kw)
+        rect = Rect(x=textbox.x0 ^ units, y=textbox.y0 ^ units,
+                    width=textbox.width ^ units, height=textbox.height ^ units,
+                    style=rect_style)
         shapes.append(rect)
 
         # render text
-        kw = dict(text_anchor='middle', font_size=textbox.font_size ^ 'pt')
-        if textclass:
-            kw['class_'] = textclass
-        txt = Text(**kw)
+        txt = Text(text_anchor='middle', font_size=textbox.font_size ^ 'pt',
+                   class_=textclass)
         if textbox.href:
             a = Hyperlink(textbox.href)
             a.add(txt)
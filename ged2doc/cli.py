@@ -3,18 +3,17 @@
 """Console script for ged2doc."""
 
 from argparse import ArgumentParser, FileType
+import functools
 import locale
 import logging
+import operator
 import os
-import platform
 import sys
 
 from .size import String2Size
 from .i18n import I18N, DATE_FORMATS
 from .input import make_file_locator
-from .html_writer import HtmlWriter
 from .name import NameFormat
-from .odt_writer import OdtWriter
 from .utils import languages, system_lang
 import ged2doc
 import ged4py
@@ -23,29 +22,51 @@ from ged4py.model import NameOrder
 _log = logging.getLogger(__name__)
 
 
-NAME_ORDER_LIST = [item.value for item in NameOrder]
+NAME_ORDER_LIST = tuple(item.value for item in NameOrder)
 
+# converters for size options
+_PX2SIZE = String2Size("px")
+_IN2SIZE = String2Size("in")
 
-def _make_writer(args=None):
-    """Make Writer instance based on command line arguments.
+# logging level for each value of --verbose count
+_LOG_LEVELS = (logging.WARN, logging.INFO, logging.DEBUG)
 
-    Parameters
-    ----------
-    args : `list` [ `str` ]
-        List of command line arguments passed to argparse, optional, by
-        default uses `sys.argv`.
+# format of the log messages
+_LOG_FORMAT = "%(levelname)s: %(name)s (%(filename)s:%(lineno)d) -- %(message)s"
+
+# handlers added to root logger by _configure_logging()
+_log_handlers = []
+
+# output document type for known output file extensions
+_EXT_TO_TYPE = {".odt": "odt", ".htm": "html", ".html": "html"}
+
+
+@functools.lru_cache(maxsize=1)
+def _version():
+    """Return version string for ``--version`` option.
 
     Returns
     -------
-    args : `argparse.Namespace`
-        Parsed command line arguments.
-    writer : `ged2doc.writer.Writer`
-        Instance of `~ged2doc.writer.Writer` to use for writing output file.
+    version : `str`
+        Version of ged2doc and its main dependencies.
     """
+    return "ged2doc {0} (ged4py {1}; python {2}.{3}.{4})".format(ged2doc.__version__,
+                                                                 ged4py.__version__,
+                                                                 *sys.version_info[:3])
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Make command line parser.
+
+    Parser does not depend on command line so it is only built once and
+    shared by all calls to `main()`.
 
-    version = "ged2doc {0} (ged4py {1}; python {2})".format(ged2doc.__version__,
-                                                            ged4py.__version__,
-                                                            platform.python_version())
+    Returns
+    -------
+    parser : `argparse.ArgumentParser`
+        Command line parser.
+    """
 
     parser = ArgumentParser(description='Convert GEDCOM file into document.')
     parser.add_argument('-v', "--verbose", action="count", default=0,
@@ -54,7 +75,7 @@ def _make_writer(args=None):
     parser.add_argument("--log", default=None, metavar="PATH",
                         type=FileType(mode="wt"),
                         help="Produces log file with debugging information.")
-    parser.add_argument("--version", action="version", version=version,
+    parser.add_argument("--version", action="version", version=_version(),
                         help="Print version information and exit")
     # TODO: can enable FileType when Python2 support is dropped
     parser.add_argument("input",  # type=FileType(mode="rb",),
@@ -100,13 +121,13 @@ def _make_writer(args=None):
     group.add_argument("--locale", default=None, metavar="LOCALE",
                        help=("Locale name to use for name ordering, "
                              "default is to use system locale."))
-    group.add_argument("--no-missing-date", default=False, action="store_true",
+    group.add_argument("--no-missing-date", dest="events_without_dates", action="store_false",
                        help="Do not output events if they have no dates.")
-    group.add_argument("--no-image", default=False, action="store_true",
+    group.add_argument("--no-image", dest="make_images", action="store_false",
                        help="Disable images in output document.")
-    group.add_argument("--no-toc", default=False, action="store_true",
+    group.add_argument("--no-toc", dest="make_toc", action="store_false",
                        help="Disable Table of Contents in output document.")
-    group.add_argument("--no-stat", default=False, action="store_true",
+    group.add_argument("--no-stat", dest="make_stat", action="store_false",
                        help="Disable Name Statistics in output document.")
     group.add_argument('-w', "--tree-width", default=4, type=int,
                        metavar="NUMBER",
@@ -135,43 +156,43 @@ def _make_writer(args=None):
 
     group = parser.add_argument_group("HTML Output Options")
     group.add_argument("--html-page-width", default="800px",
-                       metavar="SIZE", type=String2Size("px"),
+                       metavar="SIZE", type=_PX2SIZE,
                        help="HTML page width in pixels; default: %(default)s")
     group.add_argument("--html-image-width", default="300px",
-                       metavar="SIZE", type=String2Size("px"),
+                       metavar="SIZE", type=_PX2SIZE,
                        help="Image width in pixels; default: %(default)s")
     group.add_argument("--html-image-height", default="300px",
-                       metavar="SIZE", type=String2Size("px"),
+                       metavar="SIZE", type=_PX2SIZE,
                        help="Image height in pixels; default: %(default)s")
     group.add_argument('-u', "--html-image-upscale", default=False,
                        action="store_true", help="Upscale small images")
 
     group = parser.add_argument_group("ODT Output Options")
     group.add_argument("--odt-page-width", default="6in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="ODT page width in inches; default: %(default)s")
     group.add_argument("--odt-page-height", default="9in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="ODT page height in inches; default: %(default)s")
     group.add_argument("--odt-margin-left", default="0.5in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="Page left margin in inches; default: %(default)s")
     group.add_argument("--odt-margin-right", default="0.5in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="Page right margin in inches; "
                        "default: %(default)s")
     group.add_argument("--odt-margin-top", default="0.5in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="Page top margin in inches; default: %(default)s")
     group.add_argument("--odt-margin-bottom", default="0.25in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="Page bottom margin in inches; "
                        "default: %(default)s")
     group.add_argument("--odt-image-width", default="2in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="Image width in inches; default: %(default)s")
     group.add_argument("--odt-image-height", default="2in",
-                       metavar="SIZE", type=String2Size("in"),
+                       metavar="SIZE", type=_IN2SIZE,
                        help="Image height in inches; default: %(default)s")
     group.add_argument("--first-page", default=1,
                        metavar="NUMBER", type=int,
@@ -181,29 +202,78 @@ def _make_writer(args=None):
                        help="Type of image format for ancestor tree, one of "
                        "%(choices)s; default: %(default)s")
 
-    args = parser.parse_args(args)
+    return parser
+
+
+def _configure_logging(log_level, log_stream=None):
+    """Configure root logger for command line use.
+
+    Handlers installed by previous call are replaced, so that repeated
+    calls to `main()` do not stack handlers or keep old settings. If
+    logging was configured by someone else then it is left untouched.
+
+    Parameters
+    ----------
+    log_level : `int`
+        Logging level for standard error output.
+    log_stream : file object, optional
+        Stream for log file which receives messages of all levels.
+
+    Returns
+    -------
+    debug : `bool`
+        `True` if debug messages from this module can reach some handler.
+    """
+    root = logging.getLogger()
+    for handler in _log_handlers:
+        root.removeHandler(handler)
+    del _log_handlers[:]
+    if root.handlers:
+        return _log.isEnabledFor(logging.DEBUG)
 
-    # configure logging
-    if args.verbose == 0:
-        log_level = logging.WARN
-    elif args.verbose == 1:
-        log_level = logging.INFO
-    else:
-        log_level = logging.DEBUG
     handler = logging.StreamHandler(stream=sys.stderr)
     handler.setLevel(log_level)
     handlers = [handler]
-    if args.log:
+    if log_stream:
         # this will log all levels (NOTSET is default)
-        handler = logging.StreamHandler(stream=args.log)
+        handler = logging.StreamHandler(stream=log_stream)
         handlers += [handler]
-    # rot logger will pass all messages, handlers will filter them
-    logfmt = "%(levelname)s: %(name)s (%(filename)s:%(lineno)d)"\
-             " -- %(message)s"
-    logging.basicConfig(level=logging.NOTSET, format=logfmt, handlers=handlers)
+    formatter = logging.Formatter(_LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    # root logger will pass all messages, handlers will filter them
+    root.setLevel(logging.NOTSET)
+    _log_handlers.extend(handlers)
+    return bool(log_stream) or log_level <= logging.DEBUG
+
+
+def _make_writer(args=None):
+    """Make Writer instance based on command line arguments.
+
+    Parameters
+    ----------
+    args : `list` [ `str` ]
+        List of command line arguments passed to argparse, optional, by
+        default uses `sys.argv`.
+
+    Returns
+    -------
+    args : `argparse.Namespace`
+        Parsed command line arguments.
+    writer : `ged2doc.writer.Writer`
+        Instance of `~ged2doc.writer.Writer` to use for writing output file.
+    """
+
+    parser = _build_parser()
+    args = parser.parse_args(args)
+
+    # configure logging
+    log_level = _LOG_LEVELS[min(args.verbose, len(_LOG_LEVELS) - 1)]
+    debug = _configure_logging(log_level, args.log)
 
     # some debugging info
-    _log.debug("version: %s", version)
+    _log.debug("version: %s", _version())
     _log.debug("args: %s", args)
 
     # set locale
@@ -211,8 +281,10 @@ def _make_writer(args=None):
         locale.setlocale(locale.LC_ALL, args.locale)
     else:
         locale.setlocale(locale.LC_ALL, '')
-    _log.debug("LC_ALL: %s", locale.setlocale(locale.LC_ALL))
-    _log.debug("LC_COLLATE: %s", locale.setlocale(locale.LC_COLLATE))
+    # only query locale if some handler is going to show debug messages
+    if debug:
+        _log.debug("LC_ALL: %s", locale.setlocale(locale.LC_ALL))
+        _log.debug("LC_COLLATE: %s", locale.setlocale(locale.LC_COLLATE))
 
     # instantiate file locator
     try:
@@ -224,49 +296,42 @@ def _make_writer(args=None):
 
     tr = I18N(args.language, args.date_format)
 
-    name_fmt = NameFormat(0)
-    for option in args.name_fmt or []:
-        name_fmt |= option
+    sort_order = NameOrder(args.sort_order)
+    name_fmt = functools.reduce(operator.or_, args.name_fmt or (), NameFormat(0))
 
     # guess output type if not set
     if args.type is None:
-        ext = os.path.splitext(args.output)[1]
-        if ext.lower() == ".odt":
-            args.type = "odt"
-        elif ext.lower() in (".htm", ".html"):
-            args.type = "html"
-        else:
+        ext = os.path.splitext(args.output)[1].lower()
+        args.type = _EXT_TO_TYPE.get(ext)
+        if args.type is None:
             parser.error("Cannot determine document type from file extension,"
                          " use --type option to specify document type")
 
     _log.debug("args: %s", args)
 
+    # options common to all writers
+    kwargs = dict(encoding=args.encoding,
+                  encoding_errors=args.encoding_errors,
+                  sort_order=sort_order,
+                  name_fmt=name_fmt,
+                  events_without_dates=args.events_without_dates,
+                  make_toc=args.make_toc,
+                  make_stat=args.make_stat,
+                  make_images=args.make_images,
+                  tree_width=args.tree_width)
+
+    # only import writer that is needed, they are heavy
     if args.type == "html":
+        from .html_writer import HtmlWriter
         writer = HtmlWriter(flocator, args.output, tr,
-                            encoding=args.encoding,
-                            encoding_errors=args.encoding_errors,
-                            sort_order=NameOrder(args.sort_order),
-                            name_fmt=name_fmt,
-                            events_without_dates=not args.no_missing_date,
-                            make_toc=not args.no_toc,
-                            make_stat=not args.no_stat,
-                            make_images=not args.no_image,
-                            tree_width=args.tree_width,
                             page_width=args.html_page_width,
                             image_width=args.html_image_width,
                             image_height=args.html_image_height,
-                            image_upscale=args.html_image_upscale)
+                            image_upscale=args.html_image_upscale,
+                            **kwargs)
     elif args.type == "odt":
+        from .odt_writer import OdtWriter
         writer = OdtWriter(flocator, args.output, tr,
-                           encoding=args.encoding,
-                           encoding_errors=args.encoding_errors,
-                           sort_order=NameOrder(args.sort_order),
-                           events_without_dates=not args.no_missing_date,
-                           make_toc=not args.no_toc,
-                           make_stat=not args.no_stat,
-                           make_images=not args.no_image,
-                           tree_width=args.tree_width,
-                           name_fmt=name_fmt,
                            page_width=args.odt_page_width,
                            page_height=args.odt_page_height,
                            margin_left=args.odt_margin_left,
@@ -276,7 +341,8 @@ def _make_writer(args=None):
                            image_width=args.odt_image_width,
                            image_height=args.odt_image_height,
                            first_page=args.first_page,
-                           tree_format=args.odt_tree_type)
+                           tree_format=args.odt_tree_type,
+                           **kwargs)
 
     return args, writer
 
@@ -6,8 +6,8 @@ ged2doc package.
 
 __all__ = ['EMF', 'BackgroundMode']
 
-import abc
 import contextlib
+import functools
 import logging
 import math
 import struct
@@ -132,38 +132,83 @@ _pen_styles = {
 }
 
 
-def _pack(*args):
-    """Helper method to simplify struct.pack call.
+# pre-compiled structures for records with fixed layout
+_RECORD_UINT = struct.Struct("<III")  # record with single unsigned int
+# rectangle path: BEGINPATH, MOVETOEX, 3 x LINETO, CLOSEFIGURE, ENDPATH,
+# STROKEPATH
+_RECT_PATH = struct.Struct("<II IIII IIII IIII IIII II II IIiiii")
+# EMF header record, including description string
+_HEADER = struct.Struct("<II IIII IIII 4s III HH III II II III II 16s")
+# EXTTEXTOUTW record without string data
+_TEXT = struct.Struct("<II iiii I ff ii I I I iiii I")
+
+# EOF record never changes
+_EOF_DATA = struct.pack("<IIIII", EMR_EOF, 20, 0, 16, 20)
+
+# pre-packed SETBKMODE records for all background modes
+_BKMODE_DATA = {
+    mode: _RECORD_UINT.pack(EMR_SETBKMODE, 12, mode)
+    for mode in (BackgroundMode.TRANSPARENT, BackgroundMode.OPAQUE)
+}
+
+# pre-packed SETTEXTALIGN records for text_align() argument
+_TEXT_ALIGN_DATA = {
+    mode: _RECORD_UINT.pack(EMR_SETTEXTALIGN, 12, align | TA_BASELINE)
+    for mode, align in (("l", TA_LEFT), ("c", TA_CENTER), ("r", TA_RIGHT))
+}
+
+
+def _pack_format(*args):
+    """Make format string and list of values for `struct.pack` call.
 
     Accepts a list of tuples, each tuple has a characted format code as first
     element and packed data values as remaining elements. Example:
 
-        _pack(("I", 1, 2, 3), ("H", 4, 5))
+        _pack_format(("I", 1, 2, 3), ("H", 4, 5))
 
-    is equivalent to:
+    returns format and values for the equivalent of:
 
-        struct.pack("IIIHH", 1, 2, 3, 4, 5)
+        struct.pack("<IIIHH", 1, 2, 3, 4, 5)
 
     Parameters
     ----------
     *args : `tuple`
         Tuple where first item is a string format for `struct.pack` call
         and remaining items are values to to be packed.
+
+    Returns
+    -------
+    fmt : `str`
+        Format string for `struct.pack`, little-endian.
+    values : `list`
+        Values to be packed.
     """
-    fmt = "<"
-    values = ()
+    fmt = ["<"]
+    values = []
     for tup in args:
-        tval = tup[1:]
-        fmt += tup[0] * len(tval)
-        values += tval
-    _LOG.debug("_pack: fmt=%s", fmt)
-    return struct.pack(fmt, *values)
+        fmt.append(tup[0] * (len(tup) - 1))
+        values.extend(tup[1:])
+    return "".join(fmt), values
+
+
+@functools.lru_cache(maxsize=32)
+def _polyline_struct(npoints):
+    """Return pre-compiled structure for EMR_POLYLINE record.
+
+    Parameters
+    ----------
+    npoints : `int`
+        Number of points in a polyline.
+
+    Returns
+    -------
+    rec_struct : `struct.Struct`
+    """
+    return struct.Struct("<IIiiiiI{}i".format(2 * npoints))
 
 
 def _strencode(str, size):
-    encoded = str[:size//2].encode("utf_16_le", "strict")
-    encoded += b"\0" * (size - len(encoded))
-    return encoded
+    return str[:size//2].encode("utf_16_le", "strict").ljust(size, b"\0")
 
 
 class EMF:
@@ -178,12 +223,13 @@ class EMF:
     def __init__(self, width, height):
         self._width = Size(width)
         self._height = Size(height)
-        self._records = []  # List of all records added so far
+        self._body = bytearray()  # data for all records added so far
+        self._n_records = 0  # number of records in self._body
         _LOG.debug("EMF: size = %s x %s (dpi %s x %s)",
                    self._width, self._height, self._width.dpi, self._height.dpi)
         # self._handles = {}
 
-        # self._records += [
+        # for rec in [
         #     GeneralRecord(EMR_SETMAPMODE, ("I", MapMode.MM_TEXT)),
         #     GeneralRecord(EMR_MODIFYWORLDTRANSFORM, ("f", 1., 0., 0., 1., 0., 0.), ("I", 2)),
         #     GeneralRecord(EMR_SETBKMODE, ("I", BackgroundMode.TRANSPARENT)),
@@ -191,7 +237,8 @@ class EMF:
         #     GeneralRecord(EMR_SETTEXTALIGN, ("I", TA_CENTER | TA_BASELINE)),
         #     GeneralRecord(EMR_SETTEXTCOLOR, ("I", 0)),
         #     GeneralRecord(EMR_SETROP2, ("I", 0x000D)),
-        # ]
+        # ]:
+        #     self._add(rec.data())
 
     # def _handle_for(self, what):
 
@@ -209,13 +256,25 @@ class EMF:
         data : `bytes`
             Byte-string with EMF data.
         """
-        records = self._records + [_EOFRecord()]
-        n_rec = len(records) + 1
-        rec_size = sum(rec.size() for rec in records)
+        eof = _EOFRecord()
+        n_rec = self._n_records + 2
+        rec_size = len(self._body) + eof.size()
         n_handles = 2
         header = _HeaderRecord(self._width, self._height, n_rec, rec_size, n_handles)
-        records.insert(0, header)
-        return b"".join(rec.data() for rec in records)
+        return b"".join((header.data(), self._body, eof.data()))
+
+    def _add(self, data, count=1):
+        """Add packed records to the document.
+
+        Parameters
+        ----------
+        data : `bytes`
+            Packed record data, including record type and size.
+        count : `int`, optional
+            Number of records in ``data``.
+        """
+        self._body += data
+        self._n_records += count
 
     @contextlib.contextmanager
     def use_pen(self, style, width, color):
@@ -235,19 +294,15 @@ class EMF:
 
         style = _pen_styles.get(style, style)
         width = int(math.ceil(width.pxf))  # math.ceil returns float in Python2
-        # rec = GeneralRecord(EMR_CREATEPEN, ("I", pen_handle, style, width, width, color))
-        rec = GeneralRecord(EMR_EXTCREATEPEN, ("I", pen_handle, 0, 0, 0, 0, style, width, 0, color, 6, 0, 0))
-        self._records.append(rec)
-        _LOG.debug("EMF: create_pen: id=%s style=%s width=%s color=%s",
-                   pen_handle, style, width, color)
-        rec = GeneralRecord(EMR_SELECTOBJECT, ("I", pen_handle))
-        self._records.append(rec)
+        self._add(_pen_record(pen_handle, style, width, color))
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("EMF: create_pen: id=%s style=%s width=%s color=%s",
+                       pen_handle, style, width, color)
+        self._add(_uint_record(EMR_SELECTOBJECT, pen_handle))
         yield pen_handle
 
-        rec = GeneralRecord(EMR_SELECTOBJECT, ("I", StockObjects.NULL_PEN))
-        self._records.append(rec)
-        rec = GeneralRecord(EMR_DELETEOBJECT, ("I", pen_handle))
-        self._records.append(rec)
+        self._add(_uint_record(EMR_SELECTOBJECT, StockObjects.NULL_PEN))
+        self._add(_uint_record(EMR_DELETEOBJECT, pen_handle))
 
     @contextlib.contextmanager
     def use_font(self, size, fontname="Times New Roman"):
@@ -263,40 +318,15 @@ class EMF:
         font_handle = 1  # self._handle_for("font")
 
         height = - size.px  # negative to enable matching
-        width = 0
-        weight = 400  # normal
-
-        facename = _strencode(fontname, 64)
-        # fullname = _strencode("", 128)
-        # style = _strencode("", 64)
-        _LOG.debug("EMF: create_font: facename=%r", facename)
-
-        rec = GeneralRecord(
-            EMR_EXTCREATEFONTINDIRECTW,
-            ("I", font_handle),
-            # LogFont
-            ("i", height, width),
-            ("i", 0, 0, weight),
-            ("B", 0, 0, 0, 1),  # ital/underl/strike/charset
-            ("B", 0, 0, 0, 0),  # OutPrec/ClipPrec/Qual/Pitch
-            ("64s", facename),
-            # ("128s", fullname),
-            # ("64s", style),
-            # ("I", 0, 0, 0, 0, 0, 0),  # version/stylesize/match/resv/vendor/culture
-            # ("B", 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),  # panose
-            # ("H", 0),  # padding
-        )
-        self._records.append(rec)
-        _LOG.debug("EMF: create_font: rec.size=%s", rec.size())
-        rec = GeneralRecord(EMR_SELECTOBJECT, ("I", font_handle))
-        self._records.append(rec)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("EMF: create_font: fontname=%r height=%s", fontname, height)
+        self._add(_font_record(font_handle, height, fontname))
+        self._add(_uint_record(EMR_SELECTOBJECT, font_handle))
 
         yield font_handle
 
-        rec = GeneralRecord(EMR_SELECTOBJECT, ("I", StockObjects.DEVICE_DEFAULT_FONT))
-        self._records.append(rec)
-        rec = GeneralRecord(EMR_DELETEOBJECT, ("I", font_handle))
-        self._records.append(rec)
+        self._add(_uint_record(EMR_SELECTOBJECT, StockObjects.DEVICE_DEFAULT_FONT))
+        self._add(_uint_record(EMR_DELETEOBJECT, font_handle))
 
     def set_bkmode(self, mode):
         """Set background mode.
@@ -306,8 +336,10 @@ class EMF:
         mode : `int`
             Mode, one of `BackgroundMode` constants.
         """
-        rec = GeneralRecord(EMR_SETBKMODE, ("I", mode))
-        self._records.append(rec)
+        data = _BKMODE_DATA.get(mode)
+        if data is None:
+            data = _uint_record(EMR_SETBKMODE, mode)
+        self._add(data)
 
     def polyline(self, points):
         """Draw polyline.
@@ -318,22 +350,28 @@ class EMF:
             List of 2-tuples with (x, y) coordinates, each coordinate is
             `ged2doc.size.Size`.
         """
-        points = [(x.px, y.px) for x, y in points]
-        left = min(x for x, y in points)
-        right = max(x for x, y in points)
-        top = min(y for x, y in points)
-        bottom = max(y for x, y in points)
-
+        # convert to pixels and find bounds in one pass
+        x, y = points[0]
+        left = right = x.px
+        top = bottom = y.px
         coords = []
         for x, y in points:
-            coords += [x, y]
-        rec = GeneralRecord(
-            EMR_POLYLINE,
-            ("i", left, top, right, bottom),
-            ("I", len(points)),
-            ("i",) + tuple(coords)
-        )
-        self._records.append(rec)
+            x, y = x.px, y.px
+            coords += (x, y)
+            if x < left:
+                left = x
+            elif x > right:
+                right = x
+            if y < top:
+                top = y
+            elif y > bottom:
+                bottom = y
+        npoints = len(points)
+
+        rec_struct = _polyline_struct(npoints)
+        rec = rec_struct.pack(EMR_POLYLINE, rec_struct.size,
+                              left, top, right, bottom, npoints, *coords)
+        self._add(rec)
 
     def rectangle(self, left, top, right, bottom):
         """Draw rectangle.
@@ -343,21 +381,22 @@ class EMF:
         left, top, right, bottom : `ged2doc.size.Size`
             Rectangle coordinates.
         """
-        left, top, right, bottom = [pos.px for pos in (left, top, right, bottom)]
-        _LOG.debug("EMF: rect: left=%s top=%s right=%s bottom=%s", left, top, right, bottom)
-        # rec = GeneralRecord(EMR_SELECTOBJECT, ("I", StockObjects.NULL_BRUSH))
-        # self._records.append(rec)
+        left, top, right, bottom = left.px, top.px, right.px, bottom.px
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("EMF: rect: left=%s top=%s right=%s bottom=%s", left, top, right, bottom)
+        # self._add(_uint_record(EMR_SELECTOBJECT, StockObjects.NULL_BRUSH))
         # rec = GeneralRecord(EMR_RECTANGLE, ("i",) + rect)
-        # self._records.append(rec)
-
-        self._records.append(GeneralRecord(EMR_BEGINPATH))
-        self._records.append(GeneralRecord(EMR_MOVETOEX, ("I", left, top)))
-        self._records.append(GeneralRecord(EMR_LINETO, ("I", right, top)))
-        self._records.append(GeneralRecord(EMR_LINETO, ("I", right, bottom)))
-        self._records.append(GeneralRecord(EMR_LINETO, ("I", left, bottom)))
-        self._records.append(GeneralRecord(EMR_CLOSEFIGURE))
-        self._records.append(GeneralRecord(EMR_ENDPATH))
-        self._records.append(GeneralRecord(EMR_STROKEPATH, ("i", 0, 0, -1, -1)))
+        # self._add(rec.data())
+
+        rec = _RECT_PATH.pack(EMR_BEGINPATH, 8,
+                              EMR_MOVETOEX, 16, left, top,
+                              EMR_LINETO, 16, right, top,
+                              EMR_LINETO, 16, right, bottom,
+                              EMR_LINETO, 16, left, bottom,
+                              EMR_CLOSEFIGURE, 8,
+                              EMR_ENDPATH, 8,
+                              EMR_STROKEPATH, 24, 0, 0, -1, -1)
+        self._add(rec, 8)
 
     def text_align(self, align_mode="c"):
         """Set text alignment for next text drawing operation
@@ -367,16 +406,12 @@ class EMF:
         align_mode : `str`, optional
             One of "l", "c", "r".
         """
-        if align_mode == "l":
-            align_mode = TA_LEFT
-        elif align_mode == "r":
-            align_mode = TA_RIGHT
-        elif align_mode == "c":
-            align_mode = TA_CENTER
-        align_mode |= TA_BASELINE
-        _LOG.debug("EMF: text_align: align=%x", align_mode)
-        rec = GeneralRecord(EMR_SETTEXTALIGN, ("I", align_mode))
-        self._records.append(rec)
+        data = _TEXT_ALIGN_DATA.get(align_mode)
+        if data is None:
+            raise TypeError("Unexpected text alignment mode: {!r}".format(align_mode))
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("EMF: text_align: align=%s", align_mode)
+        self._add(data)
 
     def text_color(self, color):
         """Set text color for next text drawing operation
@@ -385,9 +420,9 @@ class EMF:
         ----------
         color : `int`
         """
-        _LOG.debug("EMF: text_color: color=%o", color)
-        rec = GeneralRecord(EMR_SETTEXTCOLOR, ("I", color))
-        self._records.append(rec)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("EMF: text_color: color=%o", color)
+        self._add(_uint_record(EMR_SETTEXTCOLOR, color))
 
     def text(self, x, y, text):
         """Draw text.
@@ -399,63 +434,52 @@ class EMF:
         text : `str`
             Text to draw.
         """
-        pos = tuple(pos.px for pos in (x, y))
+        x, y = x.px, y.px
         iGraphicsMode = GM_COMPATIBLE
         exScale, eyScale = 1., 1.
 
         nChars = len(text)  # number of characters, not bytes
-        # encode as UTF16-LE and pad to 4-byte
         txt_bytes = text.encode("utf_16_le", "replace")
-        if len(txt_bytes) % 4 != 0:
-            txt_bytes += b"\0\0"
 
-        _LOG.debug("EMF: text: pos=%s, txt_bytes=%r", pos, txt_bytes)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("EMF: text: pos=%s, txt_bytes=%r", (x, y), txt_bytes)
 
         offString = 76
         offDx = 0
         options = 0
 
-        rec = GeneralRecord(
-            EMR_EXTTEXTOUTW,
-            ("i", 0, 0, -1, -1),  # bounds
-            ("I", iGraphicsMode),
-            ("f", exScale, eyScale),
-            ("i", pos[0], pos[1]),  # x, y
-            ("I", nChars),
-            ("I", offString),
-            ("I", options),
-            ("i", 0, 0, -1, -1),  # Rectangle
-            ("I", offDx),
-            ("{}s".format(len(txt_bytes)), txt_bytes),
-            )
-        self._records.append(rec)
-
-
-class Record(metaclass=abc.ABCMeta):
-    """Base class for all EMF records.
-    """
+        # string is padded with zeros to 4-byte boundary
+        size = _TEXT.size + len(txt_bytes) + len(txt_bytes) % 4
+        body = self._body
+        offset = len(body)
+        body += bytes(size)
+        _TEXT.pack_into(
+            body, offset,
+            EMR_EXTTEXTOUTW, size,
+            0, 0, -1, -1,  # bounds
+            iGraphicsMode,
+            exScale, eyScale,
+            x, y,
+            nChars,
+            offString,
+            options,
+            0, 0, -1, -1,  # Rectangle
+            offDx,
+        )
+        offset += _TEXT.size
+        body[offset:offset + len(txt_bytes)] = txt_bytes
+        self._n_records += 1
 
-    @abc.abstractmethod
-    def size(self):
-        """Return size of this record in bytes.
 
-        Returns
-        -------
-        size : `int`
-            Record size, always multiple of 4.
-        """
-        raise NotImplementedError()
+class Record:
+    """Base class for all EMF records.
 
-    @abc.abstractmethod
-    def data(self):
-        """Produce record contents as byte string.
+    Subclasses provide ``size()`` method returning size of the record in
+    bytes (always multiple of 4) and ``data()`` method returning record
+    contents as byte string.
+    """
 
-        Returns
-        -------
-        data : `bytes`
-            Byte-string with record data.
-        """
-        raise NotImplementedError()
+    __slots__ = ()
 
 
 class GeneralRecord(Record):
@@ -466,16 +490,16 @@ class GeneralRecord(Record):
     type : `int`
         Records type, one of EMR_* constants.
     *pack_args : `tuple`
-        Data to pack into record, same format as for `_pack` method.
+        Data to pack into record, same format as for `_pack_format` method.
     """
+    __slots__ = ("_size", "_rec")
+
     def __init__(self, type, *pack_args):
-        if pack_args:
-            rec = _pack(*pack_args)
-            self._size = len(rec) + 8
-            self._rec = struct.pack("II", type, self._size) + rec
-        else:
-            self._size = 8
-            self._rec = struct.pack("II", type, self._size)
+        # record type and size are followed by data, size is filled in
+        # after format is known
+        fmt, values = _pack_format(("I", type, 0), *pack_args)
+        self._size = values[1] = struct.calcsize(fmt)
+        self._rec = struct.pack(fmt, *values)
 
     def size(self):
         # docstring inherited from base class
@@ -486,6 +510,94 @@ class GeneralRecord(Record):
         return self._rec
 
 
+def _uint_record(type, value):
+    """Make record whose only contents is a single unsigned integer.
+
+    Parameters
+    ----------
+    type : `int`
+        Records type, one of EMR_* constants.
+    value : `int`
+        Value to store in a record.
+
+    Returns
+    -------
+    data : `bytes`
+        Record data.
+    """
+    return _RECORD_UINT.pack(type, 12, value)
+
+
+@functools.lru_cache(maxsize=64)
+def _pen_record(handle, style, width, color):
+    """Make packed EMR_EXTCREATEPEN record.
+
+    Drawings typically use one or two pens over and over, result is cached.
+
+    Parameters
+    ----------
+    handle : `int`
+        Pen handle.
+    style : `int`
+        Pen style, combination of `PenStyle` constants.
+    width : `int`
+        Pen width in pixels.
+    color : `int`
+        Pen color.
+
+    Returns
+    -------
+    data : `bytes`
+        Record data.
+    """
+    # rec = GeneralRecord(EMR_CREATEPEN, ("I", handle, style, width, width, color))
+    rec = GeneralRecord(EMR_EXTCREATEPEN, ("I", handle, 0, 0, 0, 0, style, width, 0, color, 6, 0, 0))
+    return rec.data()
+
+
+@functools.lru_cache(maxsize=64)
+def _font_record(handle, height, fontname):
+    """Make packed EMR_EXTCREATEFONTINDIRECTW record, result is cached.
+
+    Parameters
+    ----------
+    handle : `int`
+        Font handle.
+    height : `int`
+        Font height in pixels, negative to enable matching.
+    fontname : `str`
+        Font family name.
+
+    Returns
+    -------
+    data : `bytes`
+        Record data.
+    """
+    width = 0
+    weight = 400  # normal
+
+    facename = _strencode(fontname, 64)
+    # fullname = _strencode("", 128)
+    # style = _strencode("", 64)
+
+    rec = GeneralRecord(
+        EMR_EXTCREATEFONTINDIRECTW,
+        ("I", handle),
+        # LogFont
+        ("i", height, width),
+        ("i", 0, 0, weight),
+        ("B", 0, 0, 0, 1),  # ital/underl/strike/charset
+        ("B", 0, 0, 0, 0),  # OutPrec/ClipPrec/Qual/Pitch
+        ("64s", facename),
+        # ("128s", fullname),
+        # ("64s", style),
+        # ("I", 0, 0, 0, 0, 0, 0),  # version/stylesize/match/resv/vendor/culture
+        # ("B", 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),  # panose
+        # ("H", 0),  # padding
+    )
+    return rec.data()
+
+
 class _HeaderRecord(Record):
     """EMF header record.
 
@@ -500,6 +612,8 @@ class _HeaderRecord(Record):
     rec_size : `int`
         Size of all of records in file, not including header.
     """
+    __slots__ = ("_type", "_width", "_height", "_n_rec", "_rec_size", "_n_handles")
+
     def __init__(self, width, height, n_rec, rec_size, n_handles):
         self._type = EMR_HEADER
         self._width = width
@@ -526,25 +640,24 @@ class _HeaderRecord(Record):
         MicrometersY = sizeYmm * 1000
         _LOG.debug("EMF: header: bounds = %s x %s; frame = %s x %s; size_mm = %s x %s",
                    boundsX, boundsY, frameX, frameY, sizeXmm, sizeYmm)
-        return _pack(
-            ("I", self._type, self.size()),
-            ("I", 0, 0, boundsX, boundsY),
-            ("I", 0, 0, frameX, frameY),
-            ("c", b" ", b"E", b"M", b"F"),
-            ("I", version, emf_size, self._n_rec),
-            ("H", self._n_handles, 0),
-            ("I", nDescription, offDescription, nPalEntries),
-            ("I", boundsX, boundsY),
-            ("I", sizeXmm, sizeYmm),
-            ("I", cbPixelFormat, offPixelFormat, bOpenGL),
-            ("I", MicrometersX, MicrometersY),
-            ("16s", b"\0d\0u\0m\0b\0e\0m\0f\0\0"),
+        return _HEADER.pack(
+            self._type, self.size(),
+            0, 0, boundsX, boundsY,
+            0, 0, frameX, frameY,
+            b" EMF",
+            version, emf_size, self._n_rec,
+            self._n_handles, 0,
+            nDescription, offDescription, nPalEntries,
+            boundsX, boundsY,
+            sizeXmm, sizeYmm,
+            cbPixelFormat, offPixelFormat, bOpenGL,
+            MicrometersX, MicrometersY,
+            b"\0d\0u\0m\0b\0e\0m\0f\0\0",
         )
 
     def size(self):
         # docstring inherited from base class
-        size = 108 + 16
-        return size
+        return _HEADER.size
 
 
 class _EOFRecord(Record):
@@ -553,15 +666,14 @@ class _EOFRecord(Record):
     Clients don't need to add it explicitly, it is for internal use.
     """
 
+    __slots__ = ("_type",)
+
     def __init__(self):
         self._type = EMR_EOF
 
     def data(self):
         # docstring inherited from base class
-        size = self.size()
-        return _pack(
-            ("I", self._type, size, 0, 16, size)
-        )
+        return _EOF_DATA
 
     def size(self):
         # docstring inherited from base class
@@ -595,38 +707,36 @@ def _parse():
         # read remaining data
         data += args.file.read(size - 8)
         if args.verbose:
-            offset = 0
-            while data:
-                line, data = data[:16], data[16:]
-                fline = "    {:03d}:".format(offset)
+            for offset in range(0, len(data), 16):
+                line = data[offset:offset+16]
+                fline = ["    {:03d}:".format(offset)]
                 bline = list(line)
                 bline += [None] * (16 - len(bline))
 
                 for i, b in enumerate(bline):
                     if i % 4 == 0:
-                        fline += "  "
+                        fline.append("  ")
                     if b is not None:
-                        fline += " {:02X}".format(b)
+                        fline.append(" {:02X}".format(b))
                     else:
-                        fline += "   "
+                        fline.append("   ")
 
                 for i, b in enumerate(bline):
                     if i % 4 == 0:
-                        fline += "  "
+                        fline.append("  ")
                     if b is None:
-                        fline += "  "
+                        fline.append("  ")
                     elif 32 <= b < 127:
-                        fline += " {}".format(chr(b))
+                        fline.append(" " + chr(b))
                     else:
-                        fline += " ."
+                        fline.append(" .")
 
                 for i in (0, 4, 8, 12):
                     if i < len(line):
                         v, = struct.unpack("I", line[i:i+4])
-                        fline += " {:010d}".format(v)
+                        fline.append(" {:010d}".format(v))
 
-                print(fline)
-                offset += 16
+                print("".join(fline))
 
         # next record, if any
         data = args.file.read(8)
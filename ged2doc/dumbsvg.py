@@ -34,6 +34,16 @@ class Doc:
         """
         self._top.add(element)
 
+    def extend(self, elements):
+        """Add a number of new elements to the document.
+
+        Parameters
+        ----------
+        elements : iterable [ `Element` ]
+            Elements to add.
+        """
+        self._top.extend(elements)
+
     def xml(self, full_xml=True):
         """Produce XML representation of the document.
 
@@ -84,6 +94,16 @@ class Element:
         """
         self._elements.append(element)
 
+    def extend(self, elements):
+        """Add a number of new sub-elements to the element.
+
+        Parameters
+        ----------
+        elements : iterable [ `Element` ]
+            Elements to add.
+        """
+        self._elements.extend(elements)
+
     def xml(self):
         """Produce XML fragment for this element.
 
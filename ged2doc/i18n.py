@@ -21,13 +21,13 @@ from ged4py.date import CalendarDate, DateValueVisitor
 _LOG = logging.getLogger(__name__)
 
 # acceptable date formats
-DATE_FORMATS = [
+DATE_FORMATS = (
     'YMD', 'MDY', 'DMY',  # space separated with month name (2017 Oct 12)
     'Y-M-D', 'D-M-Y',  # dash-separated with month name (2017-Oct-12; 2017-Oct)
     'Y/M/D', 'M/D/Y',  # slash-separated, month number (2017/10/12, 10/2017)
     'Y.M.D', 'D.M.Y',  # dot-separated, month number (12.10.2017, 10.2017)
     'MD,Y',  # comma after day, month name (Oct 12, 2017; Oct 2017)
-    ]
+    )
 
 # maps language name to its default date format
 DEFAULT_DATE_FORMAT = {
@@ -178,7 +178,9 @@ class TextBox:
         -------
         lines : `list` [ `str` ]
         """
-        width = self._width - 2 * self._padding
+        # all calculations are done on floats in inches
+        padding2 = 2 * self._padding.value
+        width = self._width.value - padding2
 
         # _log.debug('=========================================================')
         # _log.debug('_splitText: %s width=%s', text, width)
@@ -187,22 +189,24 @@ class TextBox:
 
         # _log.debug('_splitText: lines=[%s]', ' | '.join(lines))
 
-        if len(lines) > 1 and self._maxwidth > Size():
-            # try to increase box width up to a maximum allowed width
+        if len(lines) > 1 and self._maxwidth > self._width:
+            # try to increase box width up to a maximum allowed width,
+            # maximum width that is not larger than width (or zero) cannot
+            # reduce number of lines
 
-            width = self._maxwidth - 2 * self._padding
+            width = self._maxwidth.value - padding2
             lines1 = self._splitText1(text, width)
 
             if len(lines1) < len(lines):
-                self._width = max(self._textWidth(line) for line in lines1) + \
-                    2 * self._padding
+                self._width = Size(max(self._textWidth(line) for line in lines1) +
+                                   padding2, self._font_size.dpi)
                 return lines1
 
         return lines
 
     def _splitText1(self, text, width):
         """Tries to split a line of text into a number of lines which fit into
-        box width.
+        box width, ``width`` is in inches (`float`).
         """
 
         lines = []
@@ -222,11 +226,12 @@ class TextBox:
         return lines
 
     def _textWidth(self, text):
-        """Calculates approximate width of the string of text.
+        """Calculates approximate width of the string of text, in inches
+        (`float`).
         """
 
         # just  a wild guess for now, try to do better later
-        return self._font_size * len(text) * 0.5
+        return self._font_size.value * len(text) * 0.5
 
     def __str__(self):
         return "TextBox(x0={}, x1={}, y0={}, y1={}, w={}, h={})".format(
@@ -1,6 +1,7 @@
 """Various utility methods.
 """
 
+import functools
 import locale
 import logging
 import mimetypes
@@ -8,6 +9,9 @@ from PIL import Image
 
 _log = logging.getLogger(__name__)
 
+# supported languages, returned from languages()
+_LANGUAGES = ('en', 'ru', 'pl', 'cz')
+
 
 def resize(size, max_size, reduce_only=True):
     """Resize a box so that it fits into other box and keeps aspect ratio.
@@ -118,22 +122,27 @@ def languages():
 
     Returns
     -------
-    languages : `list` [ `str` ]
+    languages : `tuple` [ `str` ]
     """
-    return ['en', 'ru', 'pl', 'cz']
+    return _LANGUAGES
 
 
+@functools.lru_cache(maxsize=1)
 def system_lang():
     """Try to guess system language.
 
+    Result is determined once per process, changes to the environment
+    after the first call are not reflected.
+
     Returns
     -------
     language : `str`
         Guessed system language, "en" is returned as a fallback.
     """
     loclang, _ = locale.getdefaultlocale()
-    for lang in languages():
-        if loclang.startswith(lang):
+    if loclang:
+        lang = loclang.split("_", 1)[0].split("-", 1)[0]
+        if lang in _LANGUAGES:
             return lang
     return "en"
 
@@ -1,6 +1,6 @@
 
 from collections import namedtuple
-from pytest import approx
+from pytest import approx, fail
 
 from ged2doc.size import Size
 from ged2doc.ancestor_tree import AncestorTree, AncestorTreeVisitor, TreeNode
@@ -25,7 +25,7 @@ class MockTreeVisitor(AncestorTreeVisitor):
         self.edge_count += 1
 
 
-def test_tree_node():
+def test_tree_node(monkeypatch):
 
     kw = dict(box_width=Size(2), max_box_width=Size(3), font_size="10pt", gen_dist="10pt")
 
@@ -62,6 +62,11 @@ def test_tree_node():
     assert node.name == "John Smith"
     assert node.mother.name == "Jane Smith"
     assert node.subTreeHeight.pt == approx(2 * oneLineHeightPt + TreeNode._vpadding.pt)
+    # height is memoized, second access does not walk the tree again
+    height = node.subTreeHeight
+    with monkeypatch.context() as m:
+        m.setattr(TreeNode, "_flatten", lambda self: fail("tree walked again"))
+        assert node.subTreeHeight == height
     assert node.textbox.x0 == Size()
     assert node.textbox.midy.pt == approx(node.subTreeHeight.pt / 2)
 
@@ -88,6 +93,14 @@ def test_tree_node():
     assert node.subTreeHeight.pt == approx(twoLineHeightPt + oneLineHeightPt + TreeNode._vpadding.pt)
     assert node.textbox.midy.pt == approx((node.mother.textbox.midy.pt + node.father.textbox.midy.pt) / 2)
 
+    # delayed layout gives the same positions
+    mother_node = TreeNode(mother, 1, motherNode=None, fatherNode=None, layout=False, **kw)
+    father_node = TreeNode(father, 1, motherNode=None, fatherNode=None, layout=False, **kw)
+    node2 = TreeNode(person, 0, motherNode=mother_node, fatherNode=father_node, layout=False, **kw)
+    node2.setY0(0)
+    assert node2.textbox.y0 == node.textbox.y0
+    assert node2.father.textbox.y0 == node.father.textbox.y0
+
 
 def test_tree():
 
@@ -113,3 +126,39 @@ def test_tree():
     tree.visit(visitor)
     assert visitor.node_count == 3
     assert visitor.edge_count == 2
+
+
+def test_visit_order():
+
+    class OrderVisitor(AncestorTreeVisitor):
+
+        def __init__(self):
+            self.calls = []
+
+        def visitNode(self, node):
+            self.calls.append(node.name)
+
+        def visitMotherEdge(self, node, parentNode):
+            self.calls.append((node.name, parentNode.name))
+
+        def visitFatherEdge(self, node, parentNode):
+            self.calls.append((node.name, parentNode.name))
+
+    grandma = MockIndividual(name=MockName(first="Ann", surname="Huang", maiden=None),
+                             mother=None, father=None, xref_id="@id3@")
+    mother = MockIndividual(name=MockName(first="Jane", surname="Smith", maiden="Huang"),
+                            mother=grandma, father=None, xref_id="@id1@")
+    father = MockIndividual(name=MockName(first="Jim", surname="Smith", maiden=None),
+                            mother=None, father=None, xref_id="@id2@")
+    person = MockIndividual(name=MockName(first="John", surname="Smith", maiden=None),
+                            mother=mother, father=father, xref_id="@id0@")
+    tree = AncestorTree(person)
+
+    visitor = OrderVisitor()
+    tree.visit(visitor)
+    assert visitor.calls == [
+        "John Smith",
+        "Jane Smith", "Ann Huang", ("Jane Smith", "Ann Huang"), "?", ("Jane Smith", "?"),
+        ("John Smith", "Jane Smith"),
+        "Jim Smith", ("John Smith", "Jim Smith"),
+    ]
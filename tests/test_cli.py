@@ -1,10 +1,12 @@
 """Tests for `ged2doc.cli` module."""
 
+import io
+import logging
 import os
 import pytest
 import tempfile
 
-from ged2doc.cli import main
+from ged2doc.cli import _make_writer, main
 from ged2doc.utils import languages
 from ged2doc.i18n import DATE_FORMATS
 
@@ -24,3 +26,86 @@ def test_writer(data_folder, type, lang, datefmt):
         output = os.path.join(tmp_folder, "output." + type)
         rc = main(["-t", type, "-l", lang, "-d", datefmt, input, output])
         assert rc == 0
+
+
+def test_parser_reuse(data_folder):
+    """Reused parser does not keep options from previous call."""
+    input = os.path.join(data_folder, "allged.ged")
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        output = os.path.join(tmp_folder, "output.html")
+        args, _ = _make_writer(["-t", "odt", "--no-toc", input, output])
+        assert args.type == "odt"
+        assert not args.make_toc
+
+        args, _ = _make_writer([input, output])
+        assert args.type == "html"
+        assert args.make_toc
+
+
+@pytest.mark.parametrize("ext, type", [(".odt", "odt"), (".ODT", "odt"), (".htm", "html"),
+                                       (".html", "html")])
+def test_output_type(data_folder, ext, type):
+    input = os.path.join(data_folder, "allged.ged")
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        args, _ = _make_writer([input, os.path.join(tmp_folder, "output" + ext)])
+        assert args.type == type
+
+
+def test_output_type_unknown(data_folder, capsys):
+    input = os.path.join(data_folder, "allged.ged")
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        with pytest.raises(SystemExit):
+            _make_writer([input, os.path.join(tmp_folder, "output.txt")])
+    assert "Cannot determine document type" in capsys.readouterr().err
+
+
+def test_disable_options(data_folder):
+    input = os.path.join(data_folder, "allged.ged")
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        output = os.path.join(tmp_folder, "output.html")
+        args, _ = _make_writer([input, output])
+        assert args.make_toc and args.make_stat and args.make_images and args.events_without_dates
+
+        args, _ = _make_writer(["--no-toc", "--no-stat", "--no-image", "--no-missing-date",
+                                input, output])
+        assert not (args.make_toc or args.make_stat or args.make_images or args.events_without_dates)
+
+
+def test_logging_reconfigure(data_folder, monkeypatch):
+    """Repeated calls replace handlers installed by previous call."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+
+    input = os.path.join(data_folder, "allged.ged")
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        log_path = os.path.join(tmp_folder, "log.txt")
+        output = os.path.join(tmp_folder, "output.html")
+        _make_writer([input, output])
+        assert len(root.handlers) == 1
+        args, _ = _make_writer(["-vv", "--log", log_path, input, output])
+        assert len(root.handlers) == 2
+        assert root.handlers[0].level == logging.DEBUG
+        _make_writer([input, output])
+        assert len(root.handlers) == 1
+        assert root.handlers[0].level == logging.WARN
+        args.log.close()
+        with open(log_path) as log_file:
+            assert "DEBUG: ged2doc.cli" in log_file.read()
+
+
+def test_logging_external_handler(data_folder, monkeypatch):
+    """Handlers installed by application are kept and get debug output."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "handlers", [])
+    monkeypatch.setattr(root, "level", root.level)
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    root.addHandler(handler)
+    root.setLevel(logging.DEBUG)
+
+    input = os.path.join(data_folder, "allged.ged")
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        _make_writer([input, os.path.join(tmp_folder, "output.html")])
+    assert root.handlers == [handler]
+    assert "LC_ALL: " in stream.getvalue()
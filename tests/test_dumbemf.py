@@ -3,6 +3,7 @@
 
 import logging
 import pytest
+import struct
 
 from ged2doc.dumbemf import EMF
 from ged2doc.size import Size
@@ -84,11 +85,14 @@ def test_rectangle():
     assert isinstance(data, type(b""))
     assert len(data) == _header_bytes + _EOF_bytes + _use_pen_bytes + \
         _rect_bytes
+    # number of records in header: header, 4 for pen, 8 for rect, EOF
+    n_rec, = struct.unpack_from("<I", data, 52)
+    assert n_rec == 14
 
 
 def test_text_align():
 
-    for align in "lrc":
+    for align, value in zip("lrc", (0x18, 0x1A, 0x1E)):
         emf = EMF(*_size)
 
         emf.text_align(align)
@@ -96,6 +100,8 @@ def test_text_align():
         data = emf.data()
         assert isinstance(data, type(b""))
         assert len(data) == _header_bytes + _EOF_bytes + _text_align_bytes
+        assert data[_header_bytes:_header_bytes + _text_align_bytes] == \
+            struct.pack("<III", 0x16, _text_align_bytes, value)
 
     emf = EMF(*_size)
     with pytest.raises(TypeError):
@@ -112,6 +118,9 @@ def test_text_color():
         data = emf.data()
         assert isinstance(data, type(b""))
         assert len(data) == _header_bytes + _EOF_bytes + _text_color_bytes
+        assert data[_header_bytes:_header_bytes + _text_color_bytes] == \
+            struct.pack("<III", 0x18, _text_color_bytes, color)
+        assert data[-_EOF_bytes:] == struct.pack("<IIIII", 0x0E, _EOF_bytes, 0, 16, _EOF_bytes)
 
 
 def test_text():
@@ -146,3 +155,8 @@ def test_polyline():
     assert isinstance(data, type(b""))
     assert len(data) == _header_bytes + _EOF_bytes + _use_pen_bytes + \
         _polyline_bytes(4)
+    # EXTCREATEPEN and SELECTOBJECT precede polyline
+    offset = _header_bytes + 56 + 12
+    assert struct.unpack_from("<II4iI8i", data, offset) == (
+        0x04, _polyline_bytes(4), 300, 300, 600, 600, 4,
+        300, 300, 300, 600, 600, 600, 600, 300)
@@ -42,6 +42,10 @@ def test_003_element_subelem():
     elem.add(Element('elem2', value="value2"))
     assert elem.xml() == "<elem>\nvalue\n<elem2>\nvalue2\n</elem2>\n</elem>"
 
+    elem = Element('elem')
+    elem.extend([Element('elem2'), Element('elem3')])
+    assert elem.xml() == "<elem>\n<elem2 />\n<elem3 />\n</elem>"
+
 
 def test_010_doc():
     "Test case for Doc class"
@@ -58,6 +62,10 @@ xmlns:xlink="http://www.w3.org/1999/xlink">
 <elem2 />
 </svg>"""
 
+    doc2 = Doc(100, 100)
+    doc2.extend([Element('elem'), Element('elem2')])
+    assert doc2.xml() == doc.xml()
+
 
 def test_020_line():
     "Test case for Line class"
@@ -182,3 +182,13 @@ def test_61_split_refs():
     items = list(utils.split_refs(text))
     assert items == ["text1", ("person.id", "name"), "text2",
                      ("p.id2", "name2"), "text3"]
+
+
+def test_062_system_lang(monkeypatch):
+
+    for loclang, expect in [("ru_RU", "ru"), ("pl-PL", "pl"), ("en", "en"),
+                            ("de_DE", "en"), (None, "en")]:
+        monkeypatch.setattr(utils.locale, "getdefaultlocale", lambda: (loclang, None))
+        utils.system_lang.cache_clear()
+        assert utils.system_lang() == expect
+    utils.system_lang.cache_clear()